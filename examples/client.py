@@ -6,7 +6,14 @@ camera windows close cleanly even if the server stops sending frames.
 """
 
 import argparse
+import contextlib
+import os
+import queue
+import sys
+import threading
 import time
+from collections.abc import Callable
+from functools import lru_cache, partial
 
 import blosc2
 import cv2
@@ -20,6 +27,21 @@ from stretch3_zmq.core.messages.status import Status
 from stretch3_zmq.core.messages.twist_2d import Twist2D
 
 CAMERA_RECV_TIMEOUT_MS = 5000
+CAMERA_RCVBUF_BYTES = 4 * 1024 * 1024  # kernel receive buffer, room for frame bursts
+RECEIVER_POLL_MS = 100  # how often a background receiver checks for shutdown
+QUIT_KEY = ord("q")
+STATUS_FMT = "\r[Status] odom=[{:.2f}, {:.2f}, {:.2f}] runstop={} age={:.1f}ms"
+STATUS_PRINT_INTERVAL_S = 0.05  # refresh the status line at most 20 times per second
+DISPLAY_INTERVAL_S = 1 / 30  # show camera frames at most 30 times per second
+
+RGBD_HEIGHT, RGBD_WIDTH = 480, 640
+ARDUCAM_HEIGHT, ARDUCAM_WIDTH = 720, 1280
+
+# Raw z16 depth value mapped to the top of the colormap. Anything farther saturates.
+D435IF_DEPTH_MAX = 3000  # 3 m at the D435if default depth unit of 1 mm
+D405_DEPTH_MAX = 5000  # 0.5 m at the D405 default depth unit of 0.1 mm
+
+JPEG_SOI = b"\xff\xd8\xff"
 
 
 # ---------------------------------------------------------------------------
@@ -27,87 +49,178 @@ CAMERA_RECV_TIMEOUT_MS = 5000
 # ---------------------------------------------------------------------------
 
 
-def _decompress(data: bytes) -> bytes:
-    """Decompress blosc2 data, or return as-is if not compressed."""
-    try:
-        return bytes(blosc2.decompress(data))
-    except Exception:
-        return data
+def _decompress_into(data: bytes | memoryview, out: np.ndarray) -> np.ndarray:
+    """View a raw or blosc2-compressed payload as an array shaped like ``out``.
+
+    Compressed payloads are decompressed straight into ``out``; raw payloads
+    are wrapped without copying. The blosc2 header sizes must match both
+    ``out`` and the payload, and a raw frame that still looks compressed
+    falls back to the raw view instead of raising.
+    """
+    nbytes, cbytes, _ = blosc2.get_cbuffer_sizes(data)
+    if nbytes == out.nbytes and cbytes == len(data):
+        try:
+            blosc2.decompress(data, dst=out)
+            return out
+        except RuntimeError:
+            pass
+    return np.frombuffer(data, out.dtype).reshape(out.shape)
+
+
+def _decode_color(data: bytes | memoryview, out: np.ndarray) -> np.ndarray:
+    """Decode a color payload sent as JPEG, blosc2-compressed, or raw bytes.
+
+    A full-size payload is always raw, and a payload that only starts like a
+    JPEG but fails to decode is treated as blosc2 or raw instead.
+    """
+    if len(data) != out.nbytes and data[:3] == JPEG_SOI:
+        decoded: np.ndarray | None = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        if decoded is not None:
+            return decoded
+    return _decompress_into(data, out)
+
+
+def _depth_colormap_lut(depth_max: int, scale: str = "linear") -> np.ndarray:
+    """Build a 65536-entry lookup table mapping raw z16 depth to JET BGR colors.
+
+    ``scale="log"`` spreads the colormap logarithmically, giving near-range
+    detail more colors. Depths beyond ``depth_max`` saturate either way.
+    """
+    depth = np.arange(65536, dtype=np.float64).reshape(-1, 1)
+    if scale == "log":
+        levels = np.log1p(depth) * (255.0 / np.log1p(depth_max))
+    else:
+        levels = depth * (255.0 / depth_max)
+    levels_u8 = cv2.convertScaleAbs(levels)
+    return cv2.applyColorMap(levels_u8, cv2.COLORMAP_JET).reshape(65536, 3)
+
+
+class _RGBDView:
+    """Colorize depth and display RGB-D frames side-by-side in one window.
+
+    Scratch buffers for decompression, the colorized depth and the composite
+    canvas are allocated once and reused for every frame. Depth is colorized with a
+    single gather through a precomputed lookup table.
+    """
+
+    def __init__(
+        self,
+        window_name: str,
+        depth_max: int,
+        rotate_code: int | None = None,
+        depth_scale: str = "linear",
+    ) -> None:
+        self._window_name = window_name
+        self._depth_lut = _depth_colormap_lut(depth_max, depth_scale)
+        self._rotate_code = rotate_code
+
+        height, width = RGBD_HEIGHT, RGBD_WIDTH
+        if rotate_code in (cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE):
+            height, width = width, height
+
+        self._color = np.empty((RGBD_HEIGHT, RGBD_WIDTH, 3), np.uint8)
+        self._depth = np.empty((RGBD_HEIGHT, RGBD_WIDTH), np.uint16)
+        self._depth_cmap = np.empty((RGBD_HEIGHT, RGBD_WIDTH, 3), np.uint8)
+        self._canvas = np.empty((height, 2 * width, 3), np.uint8)
+        self._color_out = self._canvas[:, :width]
+        self._depth_out = self._canvas[:, width:]
+
+    def show(self, color_raw: bytes | memoryview, depth_raw: bytes | memoryview) -> None:
+        """Decode raw RGB-D buffers, colorize depth, and display side-by-side."""
+        color = _decode_color(color_raw, self._color)
+        depth = _decompress_into(depth_raw, self._depth)
+
+        if self._rotate_code is None:
+            # Write both halves straight into the canvas; no intermediate buffers.
+            np.copyto(self._color_out, color)
+            np.take(self._depth_lut, depth, axis=0, out=self._depth_out)
+        else:
+            np.take(self._depth_lut, depth, axis=0, out=self._depth_cmap)
+            cv2.rotate(color, self._rotate_code, dst=self._color_out)
+            cv2.rotate(self._depth_cmap, self._rotate_code, dst=self._depth_out)
 
+        cv2.imshow(self._window_name, self._canvas)
 
-def _show_rgbd_frame(
-    window_name: str,
-    color_raw: bytes,
-    depth_raw: bytes,
-    rotate_code: int | None = None,
-) -> None:
-    """Decode raw RGB-D buffers, colorize depth, and display side-by-side."""
-    color = np.frombuffer(_decompress(color_raw), np.uint8).reshape(480, 640, 3)
-    depth = np.frombuffer(_decompress(depth_raw), np.uint16).reshape(480, 640)
 
-    try:
-        depth_vis = cv2.normalize(depth, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U)
-    except Exception:
-        depth_vis = np.zeros_like(depth, dtype=np.uint8)
+class _RateLimiter:
+    """Pass events at most about once per interval, tolerating arrival jitter.
 
-    depth_cmap = cv2.applyColorMap(depth_vis, cv2.COLORMAP_JET)
+    An event is skipped only when it lands in the first half of the current
+    interval, and the deadline advances from the previous one rather than from
+    each arrival, so a source running at the limit rate keeps every event.
+    """
 
-    if rotate_code is not None:
-        color = cv2.rotate(color, rotate_code)
-        depth_cmap = cv2.rotate(depth_cmap, rotate_code)
+    def __init__(self, interval_s: float) -> None:
+        self._interval_s = interval_s
+        self._deadline = 0.0
 
-    cv2.imshow(window_name, np.hstack((color, depth_cmap)))
+    def ready(self, now: float) -> bool:
+        """Return whether an event arriving at ``now`` (monotonic seconds) should be handled."""
+        if now < self._deadline - self._interval_s / 2:
+            return False
+        self._deadline = max(self._deadline + self._interval_s, now)
+        return True
 
 
 def _stream_arducam(socket: zmq.Socket) -> None:
     """Stream Arducam: 1280x720, rotated 90 CW + vertical flip."""
     print("Opening Arducam (press 'q' to quit)...")
-    try:
-        while True:
-            try:
-                parts = socket.recv_multipart()
-                _, raw = decode_with_timestamp(parts)
-            except zmq.Again:
-                print("\nArducam: no frame received (timeout).")
-                break
-            frame = np.frombuffer(_decompress(raw), np.uint8).reshape(720, 1280, 3)
-            frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-            frame = cv2.flip(frame, 0)
-            cv2.imshow("Arducam", frame)
-            if cv2.waitKey(1) & 0xFF == ord("q"):
-                break
-    finally:
-        cv2.destroyAllWindows()
+    decoded = np.empty((ARDUCAM_HEIGHT, ARDUCAM_WIDTH, 3), np.uint8)
+    rotated = np.empty((ARDUCAM_WIDTH, ARDUCAM_HEIGHT, 3), np.uint8)
+    imshow, wait_key, monotonic = cv2.imshow, cv2.waitKey, time.monotonic
+    display = _RateLimiter(DISPLAY_INTERVAL_S)
+    with _LatestReceiver(socket) as receiver:
+        try:
+            while True:
+                try:
+                    frames = receiver.get(CAMERA_RECV_TIMEOUT_MS / 1000)
+                except queue.Empty:
+                    print("\nArducam: no frame received (timeout).")
+                    break
+                # Frames arriving faster than the display rate are dropped undecoded.
+                if not display.ready(monotonic()):
+                    continue
+                _, raw = decode_with_timestamp([f.buffer for f in frames])
+                frame = _decode_color(raw, decoded)
+                # Rotate 90 CW + vertical flip == anti-transpose (transpose, then flip both axes).
+                cv2.transpose(frame, rotated)
+                cv2.flip(rotated, -1, dst=rotated)
+                imshow("Arducam", rotated)
+                if wait_key(1) & 0xFF == QUIT_KEY:
+                    break
+        finally:
+            cv2.destroyAllWindows()
 
 
 def _stream_rgbd(
     name: str,
     socket: zmq.Socket,
+    depth_max: int,
     rotate_code: int | None = None,
+    depth_scale: str = "linear",
 ) -> None:
-    """Stream an RGB-D camera on a single socket, routing by topic (rgb/depth)."""
+    """Stream an RGB-D camera publishing [b"rgbd", timestamp, color, depth] messages."""
     print(f"Opening {name} (press 'q' to quit)...")
-    color_raw: bytes | None = None
-    depth_raw: bytes | None = None
-    try:
-        while True:
-            try:
-                parts = socket.recv_multipart()
-            except zmq.Again:
-                print(f"\n{name}: no frame received (timeout).")
-                break
-            topic = parts[0]
-            _, payload = decode_with_timestamp(parts[1:])
-            if topic == b"rgb":
-                color_raw = payload
-            elif topic == b"depth":
-                depth_raw = payload
-            if color_raw is not None and depth_raw is not None:
-                _show_rgbd_frame(name, color_raw, depth_raw, rotate_code)
-                if cv2.waitKey(1) & 0xFF == ord("q"):
+    view = _RGBDView(name, depth_max, rotate_code, depth_scale)
+    wait_key, monotonic = cv2.waitKey, time.monotonic
+    display = _RateLimiter(DISPLAY_INTERVAL_S)
+    with _LatestReceiver(socket) as receiver:
+        try:
+            while True:
+                try:
+                    frames = receiver.get(CAMERA_RECV_TIMEOUT_MS / 1000)
+                except queue.Empty:
+                    print(f"\n{name}: no frame received (timeout).")
                     break
-    finally:
-        cv2.destroyAllWindows()
+                # Frames arriving faster than the display rate are dropped undecoded.
+                if not display.ready(monotonic()):
+                    continue
+                _, color_raw = decode_with_timestamp([f.buffer for f in frames[1:3]])
+                view.show(color_raw, frames[3].buffer)
+                if wait_key(1) & 0xFF == QUIT_KEY:
+                    break
+        finally:
+            cv2.destroyAllWindows()
 
 
 # ---------------------------------------------------------------------------
@@ -120,17 +233,74 @@ def _connect_sub(
     address: str,
     *,
     timeout_ms: int | None = None,
+    rcvbuf: int | None = None,
 ) -> zmq.Socket:
-    """Create a SUB socket with HWM=1 and an optional receive timeout."""
+    """Create a SUB socket with HWM=1 and an optional receive timeout and kernel buffer size.
+
+    All options, including the subscription, are set before connecting so they
+    apply from the first message. CONFLATE is not used: it drops multipart
+    messages, and every stream here is multipart.
+    """
     sock = context.socket(zmq.SUB)
     sock.setsockopt(zmq.RCVHWM, 1)
+    sock.setsockopt_string(zmq.SUBSCRIBE, "")
     if timeout_ms is not None:
         sock.setsockopt(zmq.RCVTIMEO, timeout_ms)
+    if rcvbuf is not None:
+        sock.setsockopt(zmq.RCVBUF, rcvbuf)
     sock.connect(address)
-    sock.setsockopt_string(zmq.SUBSCRIBE, "")
     return sock
 
 
+def _recv_latest(socket: zmq.Socket) -> list[zmq.Frame]:
+    """Block for one multipart message, then drain any queued behind it and return the newest.
+
+    A display loop slower than the publisher thus skips stale messages
+    instead of falling further behind.
+    """
+    frames = socket.recv_multipart(copy=False)
+    while socket.poll(0, zmq.POLLIN):
+        frames = socket.recv_multipart(zmq.NOBLOCK, copy=False)
+    return frames
+
+
+class _LatestReceiver:
+    """Receive on a background thread and hand over only the newest message.
+
+    Network receive then overlaps with decoding and display on the caller's
+    thread. The socket must not be used elsewhere while the receiver runs.
+    """
+
+    def __init__(self, socket: zmq.Socket) -> None:
+        self._socket = socket
+        self._latest: queue.Queue[list[zmq.Frame]] = queue.Queue(maxsize=1)
+        self._running = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "_LatestReceiver":
+        self._running.set()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._running.clear()
+        self._thread.join()
+
+    def get(self, timeout_s: float) -> list[zmq.Frame]:
+        """Return the newest message, raising queue.Empty after ``timeout_s``."""
+        return self._latest.get(timeout=timeout_s)
+
+    def _run(self) -> None:
+        while self._running.is_set():
+            if not self._socket.poll(RECEIVER_POLL_MS, zmq.POLLIN):
+                continue
+            frames = _recv_latest(self._socket)
+            # Only this thread puts, so after dropping a stale message the put cannot fail.
+            with contextlib.suppress(queue.Empty):
+                self._latest.get_nowait()
+            self._latest.put_nowait(frames)
+
+
 # ---------------------------------------------------------------------------
 # REPL command handlers
 # ---------------------------------------------------------------------------
@@ -152,18 +322,27 @@ def _handle_asr(asr_socket: zmq.Socket) -> None:
     print(f"Transcript: {transcript}\n" if transcript else "No speech detected\n")
 
 
+@lru_cache(maxsize=128)
+def _encode_manipulator_command(positions: tuple[float, ...]) -> bytes:
+    """Validate and serialize a manipulator command, reusing the bytes for repeats."""
+    return ManipulatorCommand(joint_positions=positions).to_bytes()
+
+
+@lru_cache(maxsize=128)
+def _encode_base_command(mode: str, linear: float, angular: float) -> bytes:
+    """Validate and serialize a base command, reusing the bytes for repeats."""
+    return BaseCommand(mode=mode, twist=Twist2D(linear=linear, angular=angular)).to_bytes()
+
+
 def _handle_command(cmd_socket: zmq.Socket, args_str: str) -> None:
     try:
         if args_str:
-            positions = tuple(float(p) for p in args_str.split())
+            positions = tuple(np.array(args_str.split(), dtype=np.float64).tolist())
         else:
             print("No positions provided. Using default dummy positions.")
             positions = (0.0, 0.5, 0.2, 0.0, 0.0, 0.0, 0.0, 0.0, 100.0)
 
-        parts = [
-            b"manipulator",
-            *encode_with_timestamp(ManipulatorCommand(joint_positions=positions).to_bytes()),
-        ]
+        parts = [b"manipulator", *encode_with_timestamp(_encode_manipulator_command(positions))]
         cmd_socket.send_multipart(parts)
         print(f"Sent command: {positions}\n")
     except ValueError as e:
@@ -186,13 +365,12 @@ def _handle_base_command(cmd_socket: zmq.Socket, args_str: str) -> None:
         if tokens[-1] in ("velocity", "position"):
             mode = tokens.pop()
 
-        floats = [float(t) for t in tokens]
+        floats = np.array(tokens, dtype=np.float64).tolist()
         x = floats[0] if len(floats) > 0 else 0.0
         y = floats[1] if len(floats) > 1 else 0.0
         theta = floats[2] if len(floats) > 2 else 0.0
 
-        command = BaseCommand(mode=mode, twist=Twist2D(linear=x, angular=theta))
-        parts = [b"base", *encode_with_timestamp(command.to_bytes())]
+        parts = [b"base", *encode_with_timestamp(_encode_base_command(mode, x, theta))]
         cmd_socket.send_multipart(parts)
         print(f"Sent base command: x={x} y={y} theta={theta} mode={mode}\n")
     except ValueError as e:
@@ -225,25 +403,42 @@ def _handle_goto(goto_socket: zmq.Socket, args_str: str) -> None:
 
 def _handle_status(status_socket: zmq.Socket) -> None:
     print("Receiving status... (Ctrl+C to stop)")
+    time_ns = time.time_ns
+    fmt = STATUS_FMT.format
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    monotonic = time.monotonic
+    printer = _RateLimiter(STATUS_PRINT_INTERVAL_S)
     try:
         while True:
-            parts = status_socket.recv_multipart()
-            timestamp_ns, payload = decode_with_timestamp(parts)
-            status = Status.from_bytes(payload)
+            # Only the newest status is decoded; older queued ones are skipped.
+            frames = _recv_latest(status_socket)
+            if not printer.ready(monotonic()):
+                continue
+
+            timestamp_ns, payload = decode_with_timestamp([f.buffer for f in frames])
+            # Validation is both correct (nested models are built) and, with pydantic-core,
+            # faster than model_construct, so ignore SKIP_VALIDATION here.
+            status = Status.from_bytes(payload, validate=True)
 
             # Calculate message age for latency monitoring
-            age_ms = (time.time_ns() - timestamp_ns) / 1_000_000
+            age_ms = (time_ns() - timestamp_ns) * 1e-6
             pose = status.odometry.pose
-            odom_str = f"{pose.x:.2f}, {pose.y:.2f}, {pose.theta:.2f}"
-            print(
-                f"\r[Status] odom=[{odom_str}] runstop={status.runstop} age={age_ms:.1f}ms",
-                end="",
-                flush=True,
-            )
+            write(fmt(pose.x, pose.y, pose.theta, status.runstop, age_ms))
+            flush()
     except KeyboardInterrupt:
         print("\nStopped receiving status.\n")
 
 
+def _handle_camera(cameras: dict[str, Callable[[], None]], name: str) -> None:
+    camera_name = name.lower() or "d435if"
+    stream = cameras.get(camera_name)
+    if stream is None:
+        print(f"Unknown camera: {camera_name}. Options: {', '.join(cameras)}\n")
+        return
+    stream()
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -274,10 +469,22 @@ def main() -> None:
     parser.add_argument("--arducam-port", type=int, default=6000, help="Arducam port")
     parser.add_argument("--d435if-port", type=int, default=6001, help="D435if port")
     parser.add_argument("--d405-port", type=int, default=6002, help="D405 port")
+    parser.add_argument(
+        "--io-threads",
+        type=int,
+        default=int(os.environ.get("ZMQ_IO_THREADS", max(2, (os.cpu_count() or 2) // 2))),
+        help="ZMQ I/O threads (default: $ZMQ_IO_THREADS or half the CPU count, at least 2)",
+    )
+    parser.add_argument(
+        "--depth-scale",
+        choices=("linear", "log"),
+        default="linear",
+        help="Depth colormap scale",
+    )
     args = parser.parse_args()
 
     server_ip: str = args.server_ip
-    context = zmq.Context()
+    context = zmq.Context(io_threads=args.io_threads)
 
     try:
         # Control & speech sockets
@@ -294,8 +501,8 @@ def main() -> None:
         cmd_socket.connect(f"tcp://{server_ip}:{args.command_port}")
 
         status_socket = context.socket(zmq.SUB)
-        status_socket.connect(f"tcp://{server_ip}:{args.status_port}")
         status_socket.setsockopt_string(zmq.SUBSCRIBE, "")
+        status_socket.connect(f"tcp://{server_ip}:{args.status_port}")
 
         # Camera sockets (with receive timeout for safe shutdown)
         def cam_sub(port: int) -> zmq.Socket:
@@ -303,12 +510,39 @@ def main() -> None:
                 context,
                 f"tcp://{server_ip}:{port}",
                 timeout_ms=CAMERA_RECV_TIMEOUT_MS,
+                rcvbuf=CAMERA_RCVBUF_BYTES,
             )
 
         arducam_socket = cam_sub(args.arducam_port)
         d435if_socket = cam_sub(args.d435if_port)
         d405_socket = cam_sub(args.d405_port)
 
+        cameras: dict[str, Callable[[], None]] = {
+            "arducam": partial(_stream_arducam, arducam_socket),
+            "d435if": partial(
+                _stream_rgbd,
+                "D435if",
+                d435if_socket,
+                D435IF_DEPTH_MAX,
+                cv2.ROTATE_90_CLOCKWISE,
+                args.depth_scale,
+            ),
+            "d405": partial(
+                _stream_rgbd, "D405", d405_socket, D405_DEPTH_MAX, None, args.depth_scale
+            ),
+        }
+
+        # REPL verb -> handler taking the rest of the input line
+        handlers: dict[str, Callable[[str], None]] = {
+            "tts": partial(_handle_tts, tts_socket),
+            "asr": lambda _: _handle_asr(asr_socket),
+            "command": partial(_handle_command, cmd_socket),
+            "base": partial(_handle_base_command, cmd_socket),
+            "goto": partial(_handle_goto, goto_socket),
+            "status": lambda _: _handle_status(status_socket),
+            "camera": partial(_handle_camera, cameras),
+        }
+
         print(f"Connected to {server_ip}")
         print(HELP_TEXT)
 
@@ -322,37 +556,16 @@ def main() -> None:
             if not user_input:
                 continue
 
-            cmd = user_input.lower()
-
-            if cmd == "quit":
+            verb, _, rest = user_input.partition(" ")
+            verb = verb.lower()
+            if verb == "quit":
                 break
-            elif cmd.startswith("tts "):
-                _handle_tts(tts_socket, user_input[4:].strip())
-            elif cmd == "asr":
-                _handle_asr(asr_socket)
-            elif cmd.startswith("command"):
-                _handle_command(cmd_socket, user_input[7:].strip())
-            elif cmd.startswith("base"):
-                _handle_base_command(cmd_socket, user_input[4:].strip())
-            elif cmd.startswith("goto"):
-                _handle_goto(goto_socket, user_input[4:].strip())
-            elif cmd == "status":
-                _handle_status(status_socket)
-            elif cmd == "camera" or cmd.startswith("camera "):
-                # Parse camera name, default to d435if
-                parts = user_input.split(maxsplit=1)
-                camera_name = parts[1].strip().lower() if len(parts) > 1 else "d435if"
-
-                if camera_name == "arducam":
-                    _stream_arducam(arducam_socket)
-                elif camera_name == "d435if":
-                    _stream_rgbd("D435if", d435if_socket, cv2.ROTATE_90_CLOCKWISE)
-                elif camera_name == "d405":
-                    _stream_rgbd("D405", d405_socket)
-                else:
-                    print(f"Unknown camera: {camera_name}. Options: arducam, d435if, d405\n")
-            else:
+
+            handler = handlers.get(verb)
+            if handler is None:
                 print("Unknown command. Type a command from the list above.\n")
+            else:
+                handler(rest.strip())
 
     finally:
         context.term()
@@ -17,3 +17,9 @@ class JointName(StrEnum):
     WRIST_PITCH = "wrist_pitch"
     WRIST_ROLL = "wrist_roll"
     GRIPPER = "gripper"
+
+
+# Joint names in JointName (index) order, and the reverse lookup. Plain tuple/dict so
+# per-frame loops skip the Enum iterator; JointName members key JOINT_INDEX too.
+JOINT_NAMES: tuple[str, ...] = tuple(j.value for j in JointName)
+JOINT_INDEX: dict[str, int] = {name: i for i, name in enumerate(JOINT_NAMES)}
@@ -1,11 +1,19 @@
-from typing import Literal, cast
+from collections.abc import Buffer
+from typing import Literal
 
 import msgpack
 from pydantic import BaseModel, field_validator
 
-from ..constants import SKIP_VALIDATION, JointName
+from ..constants import JOINT_NAMES, SKIP_VALIDATION
 from .twist_2d import Twist2D
 
+# Reused across calls to skip per-call Packer setup. Decoding uses use_list=False so
+# arrays come back as tuples, matching the tuple fields even without validation.
+_packer = msgpack.Packer()
+
+# JointName is fixed at import, so its size is resolved once rather than per validation.
+_NUM_JOINTS = len(JOINT_NAMES)
+
 
 class ManipulatorCommand(BaseModel):
     joint_positions: tuple[float, ...]
@@ -13,22 +21,26 @@ class ManipulatorCommand(BaseModel):
     @field_validator("joint_positions")
     @classmethod
     def validate_joints(cls, v: tuple[float, ...]) -> tuple[float, ...]:
-        n = len(JointName)
-        if len(v) != n:
-            raise ValueError(f"Need {n} joint positions, received {len(v)}")
+        if len(v) != _NUM_JOINTS:
+            raise ValueError(f"Need {_NUM_JOINTS} joint positions, received {len(v)}")
 
         # TODO(lnfu): check range for each joint position
 
         return v
 
     def to_bytes(self) -> bytes:
-        return cast(bytes, msgpack.packb(self.model_dump()))
+        # Same map as model_dump(), built directly to skip the pydantic serializer.
+        packed: bytes = _packer.pack({"joint_positions": self.joint_positions})
+        return packed
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> "ManipulatorCommand":
-        if SKIP_VALIDATION:
-            return cls.model_construct(**msgpack.unpackb(data))
-        return cls.model_validate(msgpack.unpackb(data))
+    def from_bytes(cls, data: Buffer, *, validate: bool | None = None) -> "ManipulatorCommand":
+        """Decode a ManipulatorCommand; ``validate`` defaults to ``not SKIP_VALIDATION``."""
+        if validate is None:
+            validate = not SKIP_VALIDATION
+        if validate:
+            return cls.model_validate(msgpack.unpackb(data, use_list=False))
+        return cls.model_construct(**msgpack.unpackb(data, use_list=False))
 
 
 class BaseCommand(BaseModel):
@@ -36,10 +48,17 @@ class BaseCommand(BaseModel):
     twist: Twist2D
 
     def to_bytes(self) -> bytes:
-        return cast(bytes, msgpack.packb(self.model_dump()))
+        # Same map as model_dump(), built directly to skip the pydantic serializer.
+        twist = self.twist
+        data = {"mode": self.mode, "twist": {"linear": twist.linear, "angular": twist.angular}}
+        packed: bytes = _packer.pack(data)
+        return packed
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> "BaseCommand":
-        if SKIP_VALIDATION:
-            return cls.model_construct(**msgpack.unpackb(data))
-        return cls.model_validate(msgpack.unpackb(data))
+    def from_bytes(cls, data: Buffer, *, validate: bool | None = None) -> "BaseCommand":
+        """Decode a BaseCommand; ``validate`` defaults to ``not SKIP_VALIDATION``."""
+        if validate is None:
+            validate = not SKIP_VALIDATION
+        if validate:
+            return cls.model_validate(msgpack.unpackb(data, use_list=False))
+        return cls.model_construct(**msgpack.unpackb(data, use_list=False))
@@ -11,16 +11,26 @@ captured at message transmission time.
 
 import struct
 import time
+from collections.abc import Buffer, Sequence
 
+# Precompiled so the format string is not looked up on every message
+_TIMESTAMP = struct.Struct("!Q")
 
-def encode_with_timestamp(payload: bytes) -> list[bytes]:
+
+def encode_with_timestamp[B: Buffer](
+    payload: B, timestamp_ns: int | None = None
+) -> list[bytes | B]:
     """Encode payload with timestamp for ZeroMQ send_multipart.
 
     Args:
-        payload: Message payload as bytes (msgpack data, raw binary, etc.)
+        payload: Message payload as bytes (msgpack data, raw binary, etc.). Any
+            buffer works, e.g. a contiguous numpy array to send with
+            ``copy=False``; it is passed through without copying.
+        timestamp_ns: Nanoseconds since epoch to stamp the message with, e.g. a
+            capture time the caller already holds. Defaults to ``time.time_ns()``.
 
     Returns:
-        List of two byte frames: [timestamp_bytes, payload_bytes]
+        List of two frames: [timestamp_bytes, payload]
         Timestamp is 8 bytes in network byte order (big-endian).
 
     Example:
@@ -31,20 +41,25 @@ def encode_with_timestamp(payload: bytes) -> list[bytes]:
         >>> len(parts[0])  # timestamp is 8 bytes
         8
     """
-    timestamp_ns = time.time_ns()
-    timestamp_bytes = struct.pack("!Q", timestamp_ns)
+    if timestamp_ns is None:
+        timestamp_ns = time.time_ns()
+    timestamp_bytes = _TIMESTAMP.pack(timestamp_ns)
     return [timestamp_bytes, payload]
 
 
-def decode_with_timestamp(parts: list[bytes]) -> tuple[int, bytes]:
+def decode_with_timestamp[B: Buffer](parts: Sequence[B]) -> tuple[int, B]:
     """Decode ZeroMQ multipart message into timestamp and payload.
 
     Args:
-        parts: List of message parts from recv_multipart()
+        parts: List of message parts from recv_multipart(). Any buffer type
+            works, e.g. ``frame.buffer`` memoryviews from
+            ``recv_multipart(copy=False)``; the payload is returned as-is,
+            without copying.
 
     Returns:
         Tuple of (timestamp_ns, payload) where timestamp_ns is an integer
-        representing nanoseconds since epoch.
+        representing nanoseconds since epoch and payload has the same type
+        as the input parts.
 
     Raises:
         ValueError: If parts does not contain exactly 2 frames
@@ -61,6 +76,6 @@ def decode_with_timestamp(parts: list[bytes]) -> tuple[int, bytes]:
     if len(parts) != 2:
         raise ValueError(f"Expected 2 parts, got {len(parts)}")
 
-    timestamp_ns = struct.unpack("!Q", parts[0])[0]
+    timestamp_ns = _TIMESTAMP.unpack(parts[0])[0]
     payload = parts[1]
     return timestamp_ns, payload
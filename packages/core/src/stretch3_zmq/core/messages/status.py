@@ -1,4 +1,4 @@
-from typing import cast
+from collections.abc import Buffer
 
 import msgpack
 from pydantic import BaseModel
@@ -9,6 +9,10 @@ from .pose_2d import Pose2D
 from .twist_2d import Twist2D
 from .vector_3d import Vector3D
 
+# Reused across calls to skip per-call Packer setup. Status maps contain only plain
+# dicts/floats/bools/tuples, so packing runs entirely in C under the GIL.
+_packer = msgpack.Packer()
+
 
 class Odometry(BaseModel):
     pose: Pose2D
@@ -41,10 +45,45 @@ class Status(BaseModel):
     joint_efforts: tuple[float, ...]
 
     def to_bytes(self) -> bytes:
-        return cast(bytes, msgpack.packb(self.model_dump()))
+        # Same map as model_dump(), built directly: this runs on every status tick.
+        pose = self.odometry.pose
+        twist = self.odometry.twist
+        orientation = self.imu.orientation
+        acceleration = self.imu.acceleration
+        gyro = self.imu.gyro
+        data = {
+            "is_charging": self.is_charging,
+            "is_low_voltage": self.is_low_voltage,
+            "runstop": self.runstop,
+            "odometry": {
+                "pose": {"x": pose.x, "y": pose.y, "theta": pose.theta},
+                "twist": {"linear": twist.linear, "angular": twist.angular},
+            },
+            "imu": {
+                "orientation": {
+                    "roll": orientation.roll,
+                    "pitch": orientation.pitch,
+                    "yaw": orientation.yaw,
+                },
+                "acceleration": {"x": acceleration.x, "y": acceleration.y, "z": acceleration.z},
+                "gyro": {"x": gyro.x, "y": gyro.y, "z": gyro.z},
+            },
+            "joint_positions": self.joint_positions,
+            "joint_velocities": self.joint_velocities,
+            "joint_efforts": self.joint_efforts,
+        }
+        packed: bytes = _packer.pack(data)
+        return packed
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> "Status":
-        if SKIP_VALIDATION:
-            return cls.model_construct(**msgpack.unpackb(data))
-        return cls.model_validate(msgpack.unpackb(data))
+    def from_bytes(cls, data: Buffer, *, validate: bool | None = None) -> "Status":
+        """Decode a Status; ``validate`` defaults to ``not SKIP_VALIDATION``.
+
+        Note that validation builds the nested models, while the unvalidated
+        ``model_construct`` path leaves nested fields as plain dicts.
+        """
+        if validate is None:
+            validate = not SKIP_VALIDATION
+        if validate:
+            return cls.model_validate(msgpack.unpackb(data))
+        return cls.model_construct(**msgpack.unpackb(data))
@@ -168,9 +168,9 @@ def main() -> None:
     if config.cameras.arducam.enabled:
         logger.info(f"  - Arducam service: tcp://*:{config.ports.arducam} (PUB)")
     if config.cameras.d435if.enabled:
-        logger.info(f"  - D435i service: tcp://*:{config.ports.d435if} (PUB, topics: rgb/depth)")
+        logger.info(f"  - D435i service: tcp://*:{config.ports.d435if} (PUB, topic: rgbd)")
     if config.cameras.d405.enabled:
-        logger.info(f"  - D405 service: tcp://*:{config.ports.d405} (PUB, topics: rgb/depth)")
+        logger.info(f"  - D405 service: tcp://*:{config.ports.d405} (PUB, topic: rgbd)")
 
     try:
         # Keep main thread alive
@@ -10,7 +10,7 @@ Device selection is controlled by the ``device_preference`` constructor argument
 """
 
 import logging
-import queue
+from collections import deque
 from typing import Any, Self, cast
 
 import numpy as np
@@ -41,11 +41,15 @@ class Microphone:
 
     def __init__(self, device_preference: str = "auto") -> None:
         self._device_preference = device_preference
-        self._audio_queue: queue.Queue[bytes] = queue.Queue()
+        # Single producer (audio callback) and single consumer; deque append and
+        # popleft are atomic in CPython, so no lock is needed
+        self._audio_queue: deque[bytes] = deque()
         self._stream: sd.InputStream | None = None
         self._device_id: int | None = None
         self._channels: int = 1
         self._native_rate: int = SAMPLE_RATE
+        # Reused by the audio callback; grown if a resampled chunk is longer
+        self._int16_buf = np.empty(_CHUNK_SIZE, dtype=np.int16)
 
     def _audio_callback(
         self,
@@ -67,8 +71,12 @@ class Microphone:
                 np.arange(len(mono)),
                 mono,
             )
-        audio_bytes = (mono * 32767).astype(np.int16).tobytes()
-        self._audio_queue.put(audio_bytes)
+        if len(mono) > len(self._int16_buf):
+            self._int16_buf = np.empty(len(mono), dtype=np.int16)
+        out = self._int16_buf[: len(mono)]
+        # Scale and truncate to int16 in one pass, without float temporaries
+        np.multiply(mono, 32767, out=out, casting="unsafe")
+        self._audio_queue.append(out.tobytes())
 
     @staticmethod
     def _find_input_device(preference: str = "auto") -> tuple[int | None, int]:
@@ -154,8 +162,8 @@ class Microphone:
     def get_audio_chunk(self) -> bytes | None:
         """Get next audio chunk from queue, or None if empty."""
         try:
-            return self._audio_queue.get_nowait()
-        except queue.Empty:
+            return self._audio_queue.popleft()
+        except IndexError:
             return None
 
     def __enter__(self) -> Self:
@@ -23,6 +23,10 @@ class DeepgramProvider(BaseASRProvider):
 
     WS_BASE_URL = "wss://api.deepgram.com/v1/listen"
 
+    # Interim results are discarded, so they are recognised by this marker and never parsed.
+    # Any other spelling of the field falls through to a full JSON parse.
+    INTERIM_MARKER = '"is_final":false'
+
     @property
     def provider_name(self) -> ASRProvider:
         return ASRProvider.DEEPGRAM
@@ -59,6 +63,8 @@ class DeepgramProvider(BaseASRProvider):
 
         try:
             response = await self._ws.recv()
+            if isinstance(response, str) and self.INTERIM_MARKER in response:
+                return None
             data = json.loads(response)
 
             # Check for final transcript
@@ -42,6 +42,8 @@ class ArducamCamera(CameraBase):
         self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, self._width)
         self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self._height)
         self._cap.set(cv2.CAP_PROP_FPS, self._fps)
+        # Keep only the newest frame in the driver queue so read() never returns a stale one
+        self._cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         logger.info(
             f"Arducam started: {self._device} @ {self._width}x{self._height} {self._fps}fps"
@@ -2,6 +2,7 @@
 
 import contextlib
 import logging
+import time
 
 import numpy as np
 import pyrealsense2 as rs
@@ -10,6 +11,8 @@ from .base import CameraBase
 
 logger = logging.getLogger(__name__)
 
+DROPPED_FRAMES_LOG_INTERVAL_S = 10.0
+
 
 class RealSenseCamera(CameraBase):
     """Intel RealSense camera with color and depth streams."""
@@ -22,6 +25,8 @@ class RealSenseCamera(CameraBase):
         self._serial = serial
         self._pipeline: rs.pipeline | None = None
         self._depth_scale: float | None = None
+        self._dropped_frames = 0
+        self._next_drop_log = 0.0
 
     @property
     def depth_scale(self) -> float:
@@ -88,6 +93,12 @@ class RealSenseCamera(CameraBase):
         # TODO(lnfu): undistort (Inverse Brown-Conrady, Brown-Conrady, etc.)
         try:
             frames = self._pipeline.wait_for_frames(timeout_ms=1000)
+            # Skip to the newest frameset if more queued up while the caller was busy,
+            # so latency stays at one frame; only that one is aligned.
+            while newer := self._pipeline.poll_for_frames():
+                frames = newer
+                self._dropped_frames += 1
+            self._log_dropped_frames()
             aligned_frames = self._align.process(frames)
             color_frame = aligned_frames.get_color_frame()
             depth_frame = aligned_frames.get_depth_frame()
@@ -95,9 +106,24 @@ class RealSenseCamera(CameraBase):
             if not color_frame or not depth_frame:
                 return False, None, None
 
-            color_data = np.asanyarray(color_frame.get_data())
-            depth_data = np.asanyarray(depth_frame.get_data())
+            # Copy out of librealsense's frame pool: frames sent with copy=False can sit
+            # in the PUB queue, and holding pool frames there would stall wait_for_frames.
+            color_data = np.array(color_frame.get_data(), copy=True)
+            depth_data = np.array(depth_frame.get_data(), copy=True)
             return True, color_data, depth_data
         except Exception:
             logger.exception(f"{self._name}: Failed to read frames")
             return False, None, None
+
+    def _log_dropped_frames(self) -> None:
+        """Periodically report framesets skipped to keep up with the camera."""
+        now = time.monotonic()
+        if now < self._next_drop_log:
+            return
+        if self._dropped_frames:
+            logger.info(
+                f"{self._name}: dropped {self._dropped_frames} stale framesets "
+                f"in the last {DROPPED_FRAMES_LOG_INTERVAL_S:.0f}s"
+            )
+            self._dropped_frames = 0
+        self._next_drop_log = now + DROPPED_FRAMES_LOG_INTERVAL_S
@@ -48,6 +48,7 @@ class ASRConfig(BaseModel):
 class ArducamConfig(BaseModel):
     enabled: bool = False
     compressed: bool = False
+    jpeg: bool = False
     device: str = "/dev/video4"
     width: int = 1280
     height: int = 720
@@ -57,6 +58,7 @@ class ArducamConfig(BaseModel):
 class D435ifConfig(BaseModel):
     enabled: bool = False
     compressed: bool = False
+    jpeg: bool = False
     serial: str | None = None
     width: int = 640
     height: int = 480
@@ -66,6 +68,7 @@ class D435ifConfig(BaseModel):
 class D405Config(BaseModel):
     enabled: bool = False
     compressed: bool = False
+    jpeg: bool = False
     serial: str | None = None
     width: int = 640
     height: int = 480
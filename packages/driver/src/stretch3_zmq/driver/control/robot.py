@@ -2,7 +2,7 @@
 
 import logging
 from collections.abc import Callable
-from typing import Any
+from functools import partial
 
 import stretch_body.robot
 
@@ -18,49 +18,28 @@ logger = logging.getLogger(__name__)
 
 
 def _build_joint_commands(
+    robot: stretch_body.robot.Robot,
     profile: TrapezoidProfileConfig,
-) -> list[Callable[[stretch_body.robot.Robot, float], None]]:
-    """Build joint command callables from a trapezoid profile config."""
+) -> list[Callable[[float], None]]:
+    """Bind one command callable per joint, in JointName order, to the robot's motion methods.
+
+    Binding once up front keeps the attribute lookups off the per-command path.
+    """
     p = profile
     return [
-        lambda r, v: r.base.translate_by(v),
-        lambda r, v: r.base.rotate_by(v),
+        robot.base.translate_by,
+        robot.base.rotate_by,
         # Prismatic joints: stretch_body expects v_m / a_m
-        lambda r, v: r.lift.move_to(v, v_m=p.lift.v, a_m=p.lift.a),
-        lambda r, v: r.arm.move_to(v, v_m=p.arm.v, a_m=p.arm.a),
+        partial(robot.lift.move_to, v_m=p.lift.v, a_m=p.lift.a),
+        partial(robot.arm.move_to, v_m=p.arm.v, a_m=p.arm.a),
         # Rotary joints: stretch_body expects v_r / a_r
-        lambda r, v: r.head.move_to("head_pan", v, v_r=p.head_pan.v, a_r=p.head_pan.a),
-        lambda r, v: r.head.move_to("head_tilt", v, v_r=p.head_tilt.v, a_r=p.head_tilt.a),
-        lambda r, v: r.end_of_arm.move_to("wrist_yaw", v, v_r=p.wrist_yaw.v, a_r=p.wrist_yaw.a),
-        lambda r, v: r.end_of_arm.move_to(
-            "wrist_pitch", v, v_r=p.wrist_pitch.v, a_r=p.wrist_pitch.a
-        ),
-        lambda r, v: r.end_of_arm.move_to("wrist_roll", v, v_r=p.wrist_roll.v, a_r=p.wrist_roll.a),
-        lambda r, v: r.end_of_arm.move_to("stretch_gripper", v, v_r=p.gripper.v, a_r=p.gripper.a),
-    ]
-
-
-# Joint status reading: (status_path, pos_key, vel_key, effort_key)
-# Each entry defines how to extract position, velocity, and effort for a joint.
-_JOINT_STATUS_READERS: list[
-    tuple[
-        Callable[[dict[str, Any]], dict[str, Any]],  # extract sub-dict
-        str,  # position key
-        str,  # velocity key
-        str,  # effort key
+        partial(robot.head.move_to, "head_pan", v_r=p.head_pan.v, a_r=p.head_pan.a),
+        partial(robot.head.move_to, "head_tilt", v_r=p.head_tilt.v, a_r=p.head_tilt.a),
+        partial(robot.end_of_arm.move_to, "wrist_yaw", v_r=p.wrist_yaw.v, a_r=p.wrist_yaw.a),
+        partial(robot.end_of_arm.move_to, "wrist_pitch", v_r=p.wrist_pitch.v, a_r=p.wrist_pitch.a),
+        partial(robot.end_of_arm.move_to, "wrist_roll", v_r=p.wrist_roll.v, a_r=p.wrist_roll.a),
+        partial(robot.end_of_arm.move_to, "stretch_gripper", v_r=p.gripper.v, a_r=p.gripper.a),
     ]
-] = [
-    (lambda s: s, "", "", ""),  # base_translate: always 0.0
-    (lambda s: s, "", "", ""),  # base_rotate: always 0.0
-    (lambda s: s["lift"], "pos", "vel", "force"),
-    (lambda s: s["arm"], "pos", "vel", "force"),
-    (lambda s: s["head"]["head_pan"], "pos", "vel", "effort"),
-    (lambda s: s["head"]["head_tilt"], "pos", "vel", "effort"),
-    (lambda s: s["end_of_arm"]["wrist_yaw"], "pos", "vel", "effort"),
-    (lambda s: s["end_of_arm"]["wrist_pitch"], "pos", "vel", "effort"),
-    (lambda s: s["end_of_arm"]["wrist_roll"], "pos", "vel", "effort"),
-    (lambda s: s["end_of_arm"]["stretch_gripper"], "pos", "vel", "effort"),
-]
 
 
 class StretchRobot:
@@ -71,8 +50,10 @@ class StretchRobot:
 
     def __init__(self, profile: TrapezoidProfileConfig | None = None) -> None:
         logger.info("Initializing StretchRobot...")
-        self._joint_commands = _build_joint_commands(profile or TrapezoidProfileConfig())
         self._robot = stretch_body.robot.Robot()
+        self._joint_commands = _build_joint_commands(
+            self._robot, profile or TrapezoidProfileConfig()
+        )
         if not self._robot.startup():
             logger.error("Failed to startup stretch robot")
             raise RuntimeError("Failed to startup stretch robot")
@@ -102,15 +83,16 @@ class StretchRobot:
             )
             return
 
-        for i, (cmd_fn, value) in enumerate(
-            zip(self._joint_commands, command.joint_positions, strict=True)
-        ):
-            # TODO(lnfu): 這裡的判斷邏輯需要再想一下要不要移除
-            # Skip base_translate (i=0) and base_rotate (i=1) if their values are 0.0
-            # to avoid interfering with each other
-            if (i == 0 or i == 1) and value == 0.0:
-                continue
-            cmd_fn(self._robot, value)
+        # TODO(lnfu): 這裡的判斷邏輯需要再想一下要不要移除
+        # Skip base_translate and base_rotate if their values are 0.0
+        # to avoid interfering with each other
+        translate_fn, rotate_fn, *joint_fns = self._joint_commands
+        if base_translate != 0.0:
+            translate_fn(base_translate)
+        if base_rotate != 0.0:
+            rotate_fn(base_rotate)
+        for cmd_fn, value in zip(joint_fns, command.joint_positions[2:], strict=True):
+            cmd_fn(value)
 
         self._robot.push_command()
 
@@ -215,23 +197,30 @@ class StretchRobot:
             ),
         )
 
-        # Joints — read positions, velocities, efforts from status dict
-        positions: list[float] = []
-        velocities: list[float] = []
-        efforts: list[float] = []
-
-        for i, (extract, pos_key, vel_key, eff_key) in enumerate(_JOINT_STATUS_READERS):
-            if i == 0 or i == 1:
-                # base_translate and base_rotate: differential commands, no absolute position
-                # TODO(lnfu): 未來也許可以移除 base_rotate
-                positions.append(0.0)
-                velocities.append(0.0)
-                efforts.append(0.0)
-            else:
-                joint = extract(s)
-                positions.append(joint[pos_key])
-                velocities.append(joint[vel_key])
-                efforts.append(float(joint[eff_key]))
+        # Joints — read positions, velocities, efforts from status dict, in JointName order.
+        # base_translate and base_rotate are differential commands with no absolute
+        # position, so they always read 0.0.
+        # TODO(lnfu): 未來也許可以移除 base_rotate
+        head = s["head"]
+        end_of_arm = s["end_of_arm"]
+        lift, arm = s["lift"], s["arm"]
+        rotary = (
+            head["head_pan"],
+            head["head_tilt"],
+            end_of_arm["wrist_yaw"],
+            end_of_arm["wrist_pitch"],
+            end_of_arm["wrist_roll"],
+            end_of_arm["stretch_gripper"],
+        )
+        positions = (0.0, 0.0, lift["pos"], arm["pos"], *(j["pos"] for j in rotary))
+        velocities = (0.0, 0.0, lift["vel"], arm["vel"], *(j["vel"] for j in rotary))
+        efforts = (
+            0.0,
+            0.0,
+            float(lift["force"]),
+            float(arm["force"]),
+            *(float(j["effort"]) for j in rotary),
+        )
 
         return Status(
             is_charging=is_charging,
@@ -239,9 +228,9 @@ class StretchRobot:
             runstop=runstop,
             odometry=odometry,
             imu=imu,
-            joint_positions=tuple(positions),
-            joint_velocities=tuple(velocities),
-            joint_efforts=tuple(efforts),
+            joint_positions=positions,
+            joint_velocities=velocities,
+            joint_efforts=efforts,
         )
 
     def shutdown(self) -> None:
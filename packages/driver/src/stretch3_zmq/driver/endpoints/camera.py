@@ -5,6 +5,7 @@ import sys
 from typing import NoReturn
 
 import blosc2
+import cv2
 import numpy as np
 import zmq
 
@@ -17,10 +18,36 @@ from .zmq_helpers import zmq_socket
 
 logger = logging.getLogger(__name__)
 
+JPEG_QUALITY = 85
+
 
 def _compress(data: np.ndarray) -> bytes:
     """Compress a numpy array with blosc2 + LZ4."""
-    return bytes(blosc2.compress(data.tobytes(), typesize=data.itemsize, codec=blosc2.Codec.LZ4))
+    return bytes(blosc2.compress(data, typesize=data.itemsize, codec=blosc2.Codec.LZ4))
+
+
+def _encode_jpeg(frame: np.ndarray) -> np.ndarray:
+    """Encode an 8-bit 3-channel frame as JPEG (channel order is preserved on decode)."""
+    ok, buf = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+    if not ok:
+        raise RuntimeError("JPEG encoding failed")
+    return buf
+
+
+def _encode_frame(frame: np.ndarray, *, compressed: bool) -> bytes | np.ndarray:
+    """Serialize a frame as blosc2-compressed bytes, or pass the raw array through.
+
+    Raw arrays are sent with ``copy=False`` and stay referenced until ZeroMQ has
+    sent them, so cameras must hand over frames they no longer reuse.
+    """
+    return _compress(frame) if compressed else np.ascontiguousarray(frame)
+
+
+def _encode_color(frame: np.ndarray, *, jpeg: bool, compressed: bool) -> bytes | np.ndarray:
+    """Serialize a color frame as JPEG, blosc2-compressed, or raw."""
+    if jpeg:
+        return _encode_jpeg(frame)
+    return _encode_frame(frame, compressed=compressed)
 
 
 def _setup_camera_logger() -> None:
@@ -76,12 +103,12 @@ def arducam_endpoint(config: DriverConfig) -> NoReturn:
                 while True:
                     success, frame, _ = camera.read()
                     if success and frame is not None:
-                        payload = (
-                            _compress(frame)
-                            if config.cameras.arducam.compressed
-                            else frame.tobytes()
+                        payload = _encode_color(
+                            frame,
+                            jpeg=config.cameras.arducam.jpeg,
+                            compressed=config.cameras.arducam.compressed,
                         )
-                        socket.send_multipart(encode_with_timestamp(payload))
+                        socket.send_multipart(encode_with_timestamp(payload), copy=False)
             finally:
                 camera.stop()
     except Exception as e:
@@ -90,14 +117,16 @@ def arducam_endpoint(config: DriverConfig) -> NoReturn:
 
 
 def _realsense_endpoint(
-    camera: RealSenseCamera, port: int, name: str, compressed: bool
+    camera: RealSenseCamera, port: int, name: str, compressed: bool, jpeg: bool
 ) -> NoReturn:
     """
     RealSense endpoint: Publishes color and depth frames to ZeroMQ.
 
-    Publishes on tcp://*:{port} using topic-prefixed multipart messages:
-      [b"rgb",   timestamp, payload] - color frame
-      [b"depth", timestamp, payload] - depth frame
+    Publishes on tcp://*:{port} one topic-prefixed multipart message per
+    aligned frame pair:
+      [b"rgbd", timestamp, color_payload, depth_payload]
+
+    With ``jpeg`` the color payload is JPEG-encoded; depth is never lossy.
     """
     try:
         _setup_camera_logger()
@@ -111,12 +140,12 @@ def _realsense_endpoint(
             try:
                 while True:
                     success, color_frame, depth_frame = camera.read()
-                    if success and color_frame is not None:
-                        payload = _compress(color_frame) if compressed else color_frame.tobytes()
-                        socket.send_multipart([b"rgb", *encode_with_timestamp(payload)])
-                    if success and depth_frame is not None:
-                        payload = _compress(depth_frame) if compressed else depth_frame.tobytes()
-                        socket.send_multipart([b"depth", *encode_with_timestamp(payload)])
+                    if success and color_frame is not None and depth_frame is not None:
+                        color = _encode_color(color_frame, jpeg=jpeg, compressed=compressed)
+                        depth = _encode_frame(depth_frame, compressed=compressed)
+                        socket.send_multipart(
+                            [b"rgbd", *encode_with_timestamp(color), depth], copy=False
+                        )
             finally:
                 camera.stop()
     except Exception as e:
@@ -133,7 +162,13 @@ def d435if_endpoint(config: DriverConfig) -> NoReturn:
         fps=config.cameras.d435if.fps,
         serial=config.cameras.d435if.serial,
     )
-    _realsense_endpoint(camera, config.ports.d435if, "D435i", config.cameras.d435if.compressed)
+    _realsense_endpoint(
+        camera,
+        config.ports.d435if,
+        "D435i",
+        config.cameras.d435if.compressed,
+        config.cameras.d435if.jpeg,
+    )
 
 
 def d405_endpoint(config: DriverConfig) -> NoReturn:
@@ -145,4 +180,10 @@ def d405_endpoint(config: DriverConfig) -> NoReturn:
         fps=config.cameras.d405.fps,
         serial=config.cameras.d405.serial,
     )
-    _realsense_endpoint(camera, config.ports.d405, "D405", config.cameras.d405.compressed)
+    _realsense_endpoint(
+        camera,
+        config.ports.d405,
+        "D405",
+        config.cameras.d405.compressed,
+        config.cameras.d405.jpeg,
+    )
@@ -2,6 +2,8 @@
 
 import logging
 import os
+import queue
+import threading
 import time
 from typing import NoReturn
 
@@ -10,7 +12,7 @@ import zmq
 from ..config import DriverConfig
 from ..tts.providers import PROVIDER_ENV_KEYS, TTSConfig, TTSProvider, VoiceSettings
 from ..tts.service import TTSService
-from ..tts.speaker import play_audio
+from ..tts.speaker import play_audio_stream
 from .zmq_helpers import zmq_socket
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,8 @@ def speak_endpoint(config: DriverConfig) -> NoReturn:
     Immediately replies with a job_id (nanosecond timestamp string) upon receiving text.
     Publishes playback status on tcp://*:{ports.tts_status} using PUB socket.
     Each status message is two frames: [job_id, status ("started"|"done"|"error")].
+    Jobs are converted and played one at a time on a worker thread, so requests keep being
+    answered while earlier speech is still playing.
     """
     provider = TTSProvider(config.tts.provider)
     env_key = PROVIDER_ENV_KEYS[provider]
@@ -62,19 +66,30 @@ def speak_endpoint(config: DriverConfig) -> NoReturn:
             f"publishing status on tcp://*:{config.ports.tts_status}"
         )
 
-        while True:
-            text = rep_socket.recv_string()
-            job_id = str(time.time_ns())
-            rep_socket.send_string(job_id)
-            logger.info(f"[SPEAK] Received text (id={job_id}): {text}")
+        jobs: queue.Queue[tuple[str, str]] = queue.Queue()
 
-            if text.strip():
+        def speak_worker() -> None:
+            # Sole user of status_socket once started; ZMQ sockets are not thread-safe.
+            while True:
+                job_id, text = jobs.get()
                 status_socket.send_multipart([job_id.encode(), b"started"])
                 try:
-                    audio_data = tts_service.convert(text, tts_config)
-                    play_audio(audio_data, sample_rate=tts_sample_rate)
+                    # Playback starts with the first chunk instead of after the full response
+                    audio_chunks = tts_service.convert_stream(text, tts_config)
+                    play_audio_stream(audio_chunks, sample_rate=tts_sample_rate)
                     logger.info(f"[SPEAK] Audio playback completed (id={job_id})")
                     status_socket.send_multipart([job_id.encode(), b"done"])
                 except Exception as e:
                     logger.exception(f"[SPEAK] Error converting text to speech (id={job_id}): {e}")
                     status_socket.send_multipart([job_id.encode(), b"error"])
+
+        threading.Thread(target=speak_worker, name="SpeakWorker", daemon=True).start()
+
+        while True:
+            text = rep_socket.recv_string()
+            job_id = str(time.time_ns())
+            rep_socket.send_string(job_id)
+            logger.info(f"[SPEAK] Received text (id={job_id}): {text}")
+
+            if text.strip():
+                jobs.put((job_id, text))
@@ -26,9 +26,8 @@ def status_endpoint(config: DriverConfig, robot: StretchRobot) -> NoReturn:
     with zmq_socket(zmq.PUB, f"tcp://*:{config.ports.status}") as socket:
         logger.info(f"Status endpoint started. Publishing on tcp://*:{config.ports.status}")
 
+        next_tick = time.monotonic()
         while True:
-            loop_start = time.time()
-
             try:
                 status = robot.get_status()
                 parts = encode_with_timestamp(status.to_bytes())
@@ -36,8 +35,11 @@ def status_endpoint(config: DriverConfig, robot: StretchRobot) -> NoReturn:
             except Exception as e:
                 logger.exception(f"[STATUS] Error getting/publishing status: {e}")
 
-            # Sleep to maintain rate
-            elapsed = time.time() - loop_start
-            sleep_time = status_interval - elapsed
+            # Sleep until the next absolute deadline so the rate does not drift with loop
+            # overhead; after an overrun, restart the schedule instead of bursting to catch up.
+            next_tick += status_interval
+            sleep_time = next_tick - time.monotonic()
             if sleep_time > 0:
                 time.sleep(sleep_time)
+            else:
+                next_tick = time.monotonic()
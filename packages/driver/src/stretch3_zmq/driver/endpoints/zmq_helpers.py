@@ -5,12 +5,19 @@ from collections.abc import Generator
 
 import zmq
 
+# I/O threads for the process-wide context shared by every endpoint.
+IO_THREADS = 2
+
+
+def _shared_context() -> zmq.Context[zmq.Socket[bytes]]:
+    """Return the process-wide context; io_threads only applies on first creation."""
+    return zmq.Context.instance(io_threads=IO_THREADS)
+
 
 @contextlib.contextmanager
 def zmq_socket(socket_type: int, address: str) -> Generator[zmq.Socket[bytes], None, None]:
     """Create a bound ZeroMQ socket with automatic cleanup."""
-    context = zmq.Context()
-    socket = context.socket(socket_type)
+    socket = _shared_context().socket(socket_type)
 
     # Set HWM=8 for PUB/SUB sockets to keep only the latest message
     if socket_type == zmq.PUB:
@@ -23,15 +30,14 @@ def zmq_socket(socket_type: int, address: str) -> Generator[zmq.Socket[bytes], N
         yield socket
     finally:
         socket.close()
-        context.term()
 
 
 @contextlib.contextmanager
 def zmq_socket_pair(
     address_a: str, address_b: str
 ) -> Generator[tuple[zmq.Socket[bytes], zmq.Socket[bytes]], None, None]:
-    """Create two bound PUB sockets sharing a context, with automatic cleanup."""
-    context = zmq.Context()
+    """Create two bound PUB sockets on the shared context, with automatic cleanup."""
+    context = _shared_context()
     socket_a = context.socket(zmq.PUB)
     socket_a.setsockopt(zmq.SNDHWM, 8)
     socket_a.bind(address_a)
@@ -43,4 +49,3 @@ def zmq_socket_pair(
     finally:
         socket_a.close()
         socket_b.close()
-        context.term()
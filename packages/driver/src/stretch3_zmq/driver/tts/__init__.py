@@ -2,7 +2,7 @@
 
 from .providers import PROVIDER_ENV_KEYS, TTSConfig, TTSProvider, VoiceSettings
 from .service import ProviderNotFoundError, TTSService, TTSServiceError
-from .speaker import play_audio
+from .speaker import play_audio, play_audio_stream
 
 __all__ = [
     "PROVIDER_ENV_KEYS",
@@ -13,4 +13,5 @@ __all__ = [
     "TTSServiceError",
     "VoiceSettings",
     "play_audio",
+    "play_audio_stream",
 ]
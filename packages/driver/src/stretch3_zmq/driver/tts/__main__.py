@@ -11,7 +11,7 @@ from dotenv import load_dotenv
 from ..config import DriverConfig
 from .providers import PROVIDER_ENV_KEYS, TTSConfig, TTSProvider, VoiceSettings
 from .service import TTSService
-from .speaker import list_devices, play_audio, save_wav
+from .speaker import list_devices, play_audio_stream, save_wav
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger("tts")
@@ -169,16 +169,17 @@ def main() -> None:
     print(f"text          : {args.text!r}")
     print()
 
-    audio_data = service.convert(args.text, config)
     # Fish Audio always returns PCM at the sample_rate set in the request body (16000 Hz).
     # ElevenLabs encodes the rate in the output_format string (e.g. pcm_22050 → 22050 Hz).
     pcm_rate = 16000 if provider == TTSProvider.FISH_AUDIO else _parse_sample_rate(output_format)
 
     if args.output:
-        save_wav(audio_data, args.output, sample_rate=pcm_rate)
+        save_wav(service.convert(args.text, config), args.output, sample_rate=pcm_rate)
         print(f"Saved to {args.output}")
     else:
-        play_audio(audio_data, sample_rate=pcm_rate, device=args.device)
+        play_audio_stream(
+            service.convert_stream(args.text, config), sample_rate=pcm_rate, device=args.device
+        )
         print("Done.")
 
 
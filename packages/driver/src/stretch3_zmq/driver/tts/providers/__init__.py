@@ -2,6 +2,7 @@
 
 from .base import (
     PROVIDER_ENV_KEYS,
+    STREAM_CHUNK_BYTES,
     BaseTTSProvider,
     TTSConfig,
     TTSProvider,
@@ -12,6 +13,7 @@ from .fish_audio import FishAudioProvider
 
 __all__ = [
     "PROVIDER_ENV_KEYS",
+    "STREAM_CHUNK_BYTES",
     "BaseTTSProvider",
     "ElevenLabsProvider",
     "FishAudioProvider",
@@ -1,6 +1,7 @@
 """Abstract base class and shared types for TTS providers."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import StrEnum
 
@@ -30,6 +31,9 @@ class TTSConfig:
     voice_settings: VoiceSettings = field(default_factory=VoiceSettings)
 
 
+# Chunk size for streamed responses: 100 ms of 16-bit mono PCM at 16000 Hz
+STREAM_CHUNK_BYTES = 3200
+
 PROVIDER_ENV_KEYS: dict[TTSProvider, str] = {
     TTSProvider.ELEVENLABS: "ELEVENLABS_API_KEY",
     TTSProvider.FISH_AUDIO: "FISH_AUDIO_API_KEY",
@@ -62,6 +66,22 @@ class BaseTTSProvider(ABC):
         """
         pass
 
+    def convert_stream(self, text: str, config: TTSConfig) -> Iterator[bytes]:
+        """
+        Convert text to speech and yield audio chunks as they arrive.
+
+        The default yields the full convert() result as a single chunk; providers that
+        support chunked responses override this to start playback sooner.
+
+        Args:
+            text: The text to convert to speech.
+            config: Configuration for the TTS request.
+
+        Yields:
+            Audio bytes in the same format as convert().
+        """
+        yield self.convert(text, config)
+
     @property
     @abstractmethod
     def provider_name(self) -> TTSProvider:
@@ -1,10 +1,12 @@
 """ElevenLabs TTS provider using the v1 REST API."""
 
+from collections.abc import Iterator
 from typing import Any
 
 import httpx
 
 from .base import (
+    STREAM_CHUNK_BYTES,
     BaseTTSProvider,
     TTSConfig,
     TTSProvider,
@@ -91,3 +93,36 @@ class ElevenLabsProvider(BaseTTSProvider):
                 )
 
             return response.content
+
+    def convert_stream(self, text: str, config: TTSConfig) -> Iterator[bytes]:
+        """
+        Convert text to speech via the streaming endpoint, yielding PCM chunks.
+
+        Raises:
+            httpx.HTTPStatusError: If the API request fails.
+        """
+        voice_id = config.voice_id or self.DEFAULT_VOICE_ID
+
+        url = f"{self.base_url}/v1/text-to-speech/{voice_id}/stream"
+        params = {"output_format": config.output_format}
+        body = self._build_request_body(text, config)
+
+        with (
+            httpx.Client(timeout=60.0) as client,
+            client.stream(
+                "POST",
+                url,
+                headers=self._get_headers(),
+                params=params,
+                json=body,
+            ) as response,
+        ):
+            if not response.is_success:
+                response.read()
+                raise httpx.HTTPStatusError(
+                    f"{response.status_code} {response.reason_phrase}: {response.text}",
+                    request=response.request,
+                    response=response,
+                )
+
+            yield from response.iter_bytes(STREAM_CHUNK_BYTES)
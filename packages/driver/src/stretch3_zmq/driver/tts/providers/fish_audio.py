@@ -1,10 +1,11 @@
 """Fish Audio TTS provider using the v1 REST API."""
 
+from collections.abc import Iterator
 from typing import Any
 
 import httpx
 
-from .base import BaseTTSProvider, TTSConfig, TTSProvider
+from .base import STREAM_CHUNK_BYTES, BaseTTSProvider, TTSConfig, TTSProvider
 
 
 class FishAudioProvider(BaseTTSProvider):
@@ -72,3 +73,22 @@ class FishAudioProvider(BaseTTSProvider):
             response.raise_for_status()
 
             return response.content
+
+    def convert_stream(self, text: str, config: TTSConfig) -> Iterator[bytes]:
+        """
+        Convert text to speech, yielding PCM 16000 chunks as they arrive.
+
+        Raises:
+            httpx.HTTPStatusError: If the API request fails.
+        """
+        url = f"{self.base_url}/v1/tts"
+        body = self._build_request_body(text, config)
+        headers = self._get_headers(config.model_id)
+
+        with (
+            httpx.Client(timeout=60.0) as client,
+            client.stream("POST", url, headers=headers, json=body) as response,
+        ):
+            response.raise_for_status()
+
+            yield from response.iter_bytes(STREAM_CHUNK_BYTES)
@@ -1,5 +1,6 @@
 """Unified TTS service with provider abstraction."""
 
+from collections.abc import Iterator
 from typing import ClassVar
 
 from .providers import (
@@ -104,6 +105,19 @@ class TTSService:
         """
         return self._provider.convert(text, config)
 
+    def convert_stream(self, text: str, config: TTSConfig) -> Iterator[bytes]:
+        """
+        Convert text to speech and yield audio chunks as they arrive.
+
+        Args:
+            text: The text to convert to speech.
+            config: Configuration for the TTS request.
+
+        Yields:
+            Audio bytes (PCM, 16-bit, mono); chunk boundaries are arbitrary.
+        """
+        return self._provider.convert_stream(text, config)
+
 
 # Convenience exports
 __all__ = [
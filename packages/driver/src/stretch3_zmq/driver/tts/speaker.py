@@ -1,6 +1,9 @@
 """Audio playback utility that resamples PCM data and plays via sounddevice."""
 
 import wave
+from collections.abc import Buffer, Iterable
+from functools import lru_cache
+from math import gcd
 from pathlib import Path
 
 import numpy as np
@@ -9,6 +12,97 @@ from scipy import signal
 
 PLAYBACK_SAMPLE_RATE = 48000
 PCM_MAX_VALUE = 32768.0
+RESAMPLE_WINDOW = ("kaiser", 5.0)
+
+
+@lru_cache(maxsize=8)
+def _resample_filter(up: int, down: int) -> np.ndarray:
+    """Design the low-pass FIR used by resample_poly once per rate ratio.
+
+    Matches resample_poly's own default design, which it would otherwise redo on
+    every call. The taps are float32 so that, with float32 input, resample_poly
+    returns float32 and playback needs no extra cast.
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    taps: np.ndarray = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=RESAMPLE_WINDOW)
+    return taps.astype(np.float32)
+
+
+class _StreamResampler:
+    """Polyphase resampler that carries filter history across chunks.
+
+    Produces the same samples as resample_poly over the concatenated input, so
+    streamed audio has no seams at chunk boundaries.
+    """
+
+    def __init__(self, up: int, down: int) -> None:
+        h = _resample_filter(up, down) * up  # resample_poly scales the gain by up
+        self._up = up
+        self._down = down
+        self._half_len = (len(h) - 1) // 2
+        self._taps = -(-len(h) // up)
+        # Polyphase bank: row p holds h[p], h[p + up], h[p + 2 * up], ...
+        padded = np.zeros(self._taps * up)
+        padded[: len(h)] = h
+        self._bank = padded.reshape(self._taps, up).T.astype(np.float32)
+        # Last taps - 1 input samples; zeros stand in for samples before the stream
+        self._history = np.zeros(self._taps - 1, dtype=np.float32)
+        self._n_in = 0
+        self._n_out = 0
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Feed input samples and return every output sample they complete."""
+        first = self._n_in
+        self._n_in += len(chunk)
+        # Output m is centred on upsampled position m * down + half_len
+        end = -(-(self._n_in * self._up - self._half_len) // self._down)
+        return self._emit(chunk, first, end)
+
+    def flush(self) -> np.ndarray:
+        """Return the remaining output, treating the input after the stream as zeros."""
+        end = -(-(self._n_in * self._up) // self._down)
+        return self._emit(np.zeros(self._taps, dtype=np.float32), self._n_in, end)
+
+    def _emit(self, chunk: np.ndarray, first: int, end: int) -> np.ndarray:
+        """Return outputs up to end; first is the stream index of chunk[0]."""
+        buf = np.concatenate((self._history, chunk))
+        start = self._n_out
+        if end > start:
+            pos = np.arange(start, end) * self._down + self._half_len
+            base = first - len(self._history)
+            # Row i holds the input samples weighted by output i's filter phase
+            idx = (pos // self._up - base)[:, None] - np.arange(self._taps)
+            out: np.ndarray = np.einsum("ij,ij->i", self._bank[pos % self._up], buf[idx])
+            self._n_out = end
+        else:
+            out = np.empty(0, dtype=np.float32)
+        if len(self._history):
+            self._history = buf[-len(self._history) :]
+        return out
+
+
+def _pcm_to_float32(audio_data: Buffer) -> np.ndarray:
+    """Convert 16-bit PCM to float32 in [-1.0, 1.0].
+
+    Cast and scale run as one ufunc pass; 1/32768 is exact, so results match a divide.
+    """
+    audio: np.ndarray = np.multiply(
+        np.frombuffer(audio_data, dtype=np.int16),
+        np.float32(1.0 / PCM_MAX_VALUE),
+        dtype=np.float32,
+    )
+    return audio
+
+
+def _resample_ratio(sample_rate: int) -> tuple[int, int]:
+    """Return the reduced (up, down) factors from sample_rate to PLAYBACK_SAMPLE_RATE."""
+    g = gcd(PLAYBACK_SAMPLE_RATE, sample_rate)
+    return PLAYBACK_SAMPLE_RATE // g, sample_rate // g
+
+
+def _output_device(device: int | None) -> int:
+    return device if device is not None else sd.default.device[1]
 
 
 def list_devices() -> None:
@@ -35,19 +129,53 @@ def save_wav(audio_data: bytes, path: str | Path, sample_rate: int = 16000) -> N
 
 
 def play_audio(audio_data: bytes, sample_rate: int = 22050, device: int | None = None) -> None:
-    # Convert bytes to numpy array (16-bit PCM) then normalize to float32 [-1.0, 1.0]
-    audio_array = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / PCM_MAX_VALUE
+    audio_array = _pcm_to_float32(audio_data)
 
     # Resample to 48000 Hz (more widely supported by hardware)
     if sample_rate == PLAYBACK_SAMPLE_RATE:
         resampled_audio = audio_array
     else:
-        num_samples = int(len(audio_array) * PLAYBACK_SAMPLE_RATE / sample_rate)
-        resampled_audio = signal.resample(audio_array, num_samples).astype(np.float32)
+        # Polyphase FIR instead of an FFT over the whole utterance
+        up, down = _resample_ratio(sample_rate)
+        resampled_audio = signal.resample_poly(
+            audio_array, up, down, window=_resample_filter(up, down)
+        ).astype(np.float32, copy=False)
 
     sd.play(
         resampled_audio,
         samplerate=PLAYBACK_SAMPLE_RATE,
-        device=device if device is not None else sd.default.device[1],
+        device=_output_device(device),
         blocking=True,
     )
+
+
+def play_audio_stream(
+    chunks: Iterable[bytes], sample_rate: int = 22050, device: int | None = None
+) -> None:
+    """Play 16-bit mono PCM chunks as they arrive, resampling each one to 48000 Hz.
+
+    Blocks until the last chunk has finished playing.
+    """
+    resampler = None
+    if sample_rate != PLAYBACK_SAMPLE_RATE:
+        resampler = _StreamResampler(*_resample_ratio(sample_rate))
+
+    pending = b""  # odd trailing byte of a chunk that split a sample
+    with sd.OutputStream(
+        samplerate=PLAYBACK_SAMPLE_RATE,
+        channels=1,
+        dtype="float32",
+        device=_output_device(device),
+    ) as stream:
+        for chunk in chunks:
+            if pending:
+                chunk = pending + chunk
+            usable = len(chunk) & ~1
+            pending = chunk[usable:]
+            audio = _pcm_to_float32(memoryview(chunk)[:usable])
+            if resampler is not None:
+                audio = resampler.process(audio)
+            if len(audio):
+                stream.write(audio)
+        if resampler is not None:
+            stream.write(resampler.flush())
@@ -1,11 +1,12 @@
-"""Tests for ManipulatorCommand data model serialization and validation."""
+"""Tests for ManipulatorCommand and BaseCommand serialization and validation."""
 
 import msgpack
 import pytest
 from pydantic import ValidationError
 
 import stretch3_zmq.core.messages.command as cmd_module
-from stretch3_zmq.core.messages.command import ManipulatorCommand
+from stretch3_zmq.core.messages.command import BaseCommand, ManipulatorCommand
+from stretch3_zmq.core.messages.twist_2d import Twist2D
 
 
 class TestManipulatorCommand:
@@ -105,8 +106,55 @@ class TestManipulatorCommand:
         with pytest.raises(ValidationError):
             ManipulatorCommand.from_bytes(data)
 
+    def test_validate_false_overrides_setting(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """validate=False skips validation even when SKIP_VALIDATION is off."""
+        monkeypatch.setattr(cmd_module, "SKIP_VALIDATION", False)
+        data = msgpack.packb({"joint_positions": [1.0, 2.0]})
+        cmd = ManipulatorCommand.from_bytes(data, validate=False)
+        assert len(cmd.joint_positions) == 2
+
+    def test_validate_true_overrides_setting(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """validate=True enforces the joint count even when SKIP_VALIDATION is on."""
+        monkeypatch.setattr(cmd_module, "SKIP_VALIDATION", True)
+        data = msgpack.packb({"joint_positions": [1.0, 2.0]})
+        with pytest.raises(ValidationError):
+            ManipulatorCommand.from_bytes(data, validate=True)
+
+    def test_to_bytes_matches_model_dump(self) -> None:
+        cmd = ManipulatorCommand(joint_positions=(0.5,) * 10)
+        assert cmd.to_bytes() == msgpack.packb(cmd.model_dump())
+
+    def test_unvalidated_joint_positions_are_tuple(self) -> None:
+        positions = (0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0)
+        data = ManipulatorCommand(joint_positions=positions).to_bytes()
+        cmd = ManipulatorCommand.from_bytes(data, validate=False)
+        assert cmd.joint_positions == positions
+
     def test_from_bytes_wrong_type_for_joint(self) -> None:
         """Non-numeric values in joint_positions should raise ValidationError."""
         data = msgpack.packb({"joint_positions": ["a"] * 10})
         with pytest.raises(ValidationError):
             ManipulatorCommand.from_bytes(data)
+
+
+class TestBaseCommand:
+    def test_from_bytes_roundtrip(self) -> None:
+        original = BaseCommand(mode="position", twist=Twist2D(linear=0.5, angular=0.0))
+        restored = BaseCommand.from_bytes(original.to_bytes())
+        assert restored == original
+
+    def test_to_bytes_matches_model_dump(self) -> None:
+        cmd = BaseCommand(mode="position", twist=Twist2D(linear=0.25, angular=-0.5))
+        assert cmd.to_bytes() == msgpack.packb(cmd.model_dump())
+
+    def test_validate_true_rejects_unknown_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(cmd_module, "SKIP_VALIDATION", True)
+        data = msgpack.packb({"mode": "teleport", "twist": {"linear": 0.0, "angular": 0.0}})
+        with pytest.raises(ValidationError):
+            BaseCommand.from_bytes(data, validate=True)
+
+    def test_validate_false_overrides_setting(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(cmd_module, "SKIP_VALIDATION", False)
+        data = msgpack.packb({"mode": "teleport", "twist": {"linear": 0.0, "angular": 0.0}})
+        cmd = BaseCommand.from_bytes(data, validate=False)
+        assert cmd.model_dump(include={"mode"})["mode"] == "teleport"
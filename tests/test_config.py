@@ -148,6 +148,7 @@ class TestArducamConfig:
         assert cam.width == 1280
         assert cam.height == 720
         assert cam.fps == 30
+        assert cam.jpeg is False
 
     def test_enable(self) -> None:
         cam = ArducamConfig(enabled=True)
@@ -172,6 +173,11 @@ class TestD435ifConfig:
         assert cam.enabled is True
         assert cam.serial == "123456789"
 
+    def test_jpeg(self) -> None:
+        cam = D435ifConfig(jpeg=True)
+        assert cam.jpeg is True
+        assert cam.compressed is False
+
 
 class TestD405Config:
     def test_defaults(self) -> None:
@@ -1,4 +1,4 @@
-"""Tests for JointName enum and SKIP_VALIDATION constant."""
+"""Tests for JointName enum, joint lookup tables and SKIP_VALIDATION constant."""
 
 import importlib
 import os
@@ -6,7 +6,7 @@ from enum import StrEnum
 
 import pytest
 
-from stretch3_zmq.core.constants import JointName
+from stretch3_zmq.core.constants import JOINT_INDEX, JOINT_NAMES, JointName
 
 
 class TestJointName:
@@ -61,6 +61,19 @@ class TestJointName:
         assert len(names) == 10
 
 
+class TestJointTables:
+    def test_names_follow_enum_order(self) -> None:
+        assert [j.value for j in JointName] == list(JOINT_NAMES)
+
+    def test_index_matches_names(self) -> None:
+        for i, name in enumerate(JOINT_NAMES):
+            assert JOINT_INDEX[name] == i
+
+    def test_index_accepts_enum_members(self) -> None:
+        assert JOINT_INDEX[JointName.LIFT] == 2
+        assert JOINT_INDEX[JointName.GRIPPER] == 9
+
+
 class TestSkipValidation:
     def test_default_is_false(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """SKIP_VALIDATION defaults to False when env var is absent."""
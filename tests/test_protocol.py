@@ -78,6 +78,14 @@ def test_network_byte_order() -> None:
         assert native_ts > 0
 
 
+def test_encode_with_explicit_timestamp() -> None:
+    """Verify a caller-supplied timestamp is used instead of the current time."""
+    parts = encode_with_timestamp(b"frame", timestamp_ns=1234567890000000000)
+    timestamp_ns, payload = decode_with_timestamp(parts)
+    assert timestamp_ns == 1234567890000000000
+    assert payload == b"frame"
+
+
 def test_timestamp_is_nanoseconds() -> None:
     """Verify timestamp is in nanoseconds since epoch."""
     payload = b"test"
@@ -117,3 +125,13 @@ def test_timestamp_precision() -> None:
     # Second timestamp should be >= first (monotonic)
     # Note: on some systems, time.time_ns() may have limited resolution
     assert ts2 >= ts1
+
+
+def test_decode_accepts_memoryviews() -> None:
+    """Verify decode works on zero-copy buffers and returns the payload view as-is."""
+    parts = [memoryview(p) for p in encode_with_timestamp(b"frame data")]
+    timestamp_ns, payload = decode_with_timestamp(parts)
+
+    assert timestamp_ns > 0
+    assert payload is parts[1]
+    assert bytes(payload) == b"frame data"
@@ -104,7 +104,7 @@ def mock_robot() -> Iterator[tuple["StretchRobot", MagicMock]]:
     mock_inner = _make_mock_inner()
     robot = StretchRobot.__new__(StretchRobot)
     robot._robot = mock_inner
-    robot._joint_commands = _build_joint_commands(TrapezoidProfileConfig())
+    robot._joint_commands = _build_joint_commands(mock_inner, TrapezoidProfileConfig())
     yield robot, mock_inner
 
 
@@ -261,6 +261,22 @@ class TestGetStatusLogic:
         status = robot.get_status()
         assert status.joint_positions[3] == 0.45  # arm is index 3
 
+    def test_get_status_rotary_joint_order(
+        self, mock_robot: tuple["StretchRobot", MagicMock]
+    ) -> None:
+        """Head and end-of-arm joints land at their JointName indices."""
+        robot, inner = mock_robot
+        inner.status["head"]["head_pan"]["pos"] = 0.4
+        inner.status["head"]["head_tilt"]["vel"] = 0.5
+        inner.status["end_of_arm"]["wrist_yaw"]["effort"] = 6
+        inner.status["end_of_arm"]["stretch_gripper"]["pos"] = 0.9
+        status = robot.get_status()
+        assert status.joint_positions[4] == 0.4  # head_pan
+        assert status.joint_velocities[5] == 0.5  # head_tilt
+        assert status.joint_efforts[6] == 6.0  # wrist_yaw
+        assert isinstance(status.joint_efforts[6], float)
+        assert status.joint_positions[9] == 0.9  # gripper
+
     def test_get_status_odometry_fields(self, mock_robot: tuple["StretchRobot", MagicMock]) -> None:
         robot, inner = mock_robot
         inner.status["base"]["x"] = 3.0
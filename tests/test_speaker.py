@@ -0,0 +1,62 @@
+"""Tests for TTS audio playback helpers."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from scipy import signal
+
+from stretch3_zmq.driver.tts.speaker import (
+    PLAYBACK_SAMPLE_RATE,
+    _resample_filter,
+    _resample_ratio,
+    _StreamResampler,
+    play_audio_stream,
+)
+
+
+class TestStreamResampler:
+    @pytest.mark.parametrize("sample_rate", [16000, 22050, 24000, 44100])
+    def test_matches_resample_poly(self, sample_rate: int) -> None:
+        """Chunked output must equal resample_poly over the whole signal."""
+        rng = np.random.default_rng(0)
+        audio = rng.uniform(-1.0, 1.0, sample_rate // 2 + 7).astype(np.float32)
+        up, down = _resample_ratio(sample_rate)
+        expected = signal.resample_poly(audio, up, down, window=_resample_filter(up, down))
+
+        resampler = _StreamResampler(up, down)
+        bounds = np.cumsum(rng.integers(1, 2000, size=len(audio)))
+        chunks = np.split(audio, bounds[bounds < len(audio)])
+        out = np.concatenate([resampler.process(c) for c in chunks] + [resampler.flush()])
+
+        assert out.dtype == np.float32
+        np.testing.assert_allclose(out, expected, atol=1e-5)
+
+    def test_empty_chunk_returns_nothing(self) -> None:
+        resampler = _StreamResampler(*_resample_ratio(16000))
+        assert len(resampler.process(np.empty(0, dtype=np.float32))) == 0
+
+
+class TestPlayAudioStream:
+    @pytest.fixture
+    def stream(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        output_stream = MagicMock()
+        monkeypatch.setattr("stretch3_zmq.driver.tts.speaker.sd.OutputStream", output_stream)
+        written: MagicMock = output_stream.return_value.__enter__.return_value
+        return written
+
+    def test_native_rate_played_unchanged(self, stream: MagicMock) -> None:
+        """Samples split across chunk boundaries must be reassembled."""
+        pcm = np.arange(-50, 50, dtype=np.int16).tobytes()
+        chunks = [pcm[:3], pcm[3:101], pcm[101:]]  # odd splits cut samples in half
+        play_audio_stream(chunks, sample_rate=PLAYBACK_SAMPLE_RATE, device=0)
+
+        played = np.concatenate([c.args[0] for c in stream.write.call_args_list])
+        np.testing.assert_array_equal(played, np.arange(-50, 50) / 32768.0)
+
+    def test_resampled_length(self, stream: MagicMock) -> None:
+        pcm = np.zeros(1600, dtype=np.int16).tobytes()
+        play_audio_stream([pcm[:1000], pcm[1000:]], sample_rate=16000, device=0)
+
+        played = sum(len(c.args[0]) for c in stream.write.call_args_list)
+        assert played == 1600 * 3
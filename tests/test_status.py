@@ -112,6 +112,11 @@ class TestStatus:
         with pytest.raises(ValidationError):
             Status.from_bytes(data)
 
+    def test_to_bytes_matches_model_dump(self) -> None:
+        """The hand-built wire map must stay identical to model_dump()."""
+        status = _make_status()
+        assert status.to_bytes() == msgpack.packb(status.model_dump())
+
     def test_to_bytes_is_deterministic(self) -> None:
         status = _make_status()
         assert status.to_bytes() == status.to_bytes()
@@ -130,6 +135,25 @@ class TestStatus:
         with pytest.raises(ValidationError):
             Status.from_bytes(data)
 
+    def test_validate_true_builds_nested_models(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """validate=True ignores SKIP_VALIDATION and returns fully built nested models."""
+        monkeypatch.setattr(status_module, "SKIP_VALIDATION", True)
+        status = Status.from_bytes(_make_status().to_bytes(), validate=True)
+        assert isinstance(status.odometry.pose, Pose2D)
+        assert status.odometry.pose.x == 1.0
+
+    def test_validate_false_overrides_setting(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(status_module, "SKIP_VALIDATION", False)
+        data = msgpack.packb({"is_charging": False})
+        status = Status.from_bytes(data, validate=False)
+        assert status.is_charging is False
+
+    def test_validate_true_overrides_setting(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(status_module, "SKIP_VALIDATION", True)
+        data = msgpack.packb({"is_charging": False})
+        with pytest.raises(ValidationError):
+            Status.from_bytes(data, validate=True)
+
     def test_joint_values_roundtrip(self) -> None:
         positions = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
         velocities = (1.0, 1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8)
@@ -138,3 +138,23 @@ class TestZmqSocketPair:
             assert str(port_a) in ep_a
             assert str(port_b) in ep_b
             assert ep_a != ep_b
+
+
+class TestSharedContext:
+    def test_helpers_share_one_context(self) -> None:
+        """Sockets from both helpers must come from the process-wide context."""
+        with (
+            zmq_socket(zmq.PUB, f"tcp://127.0.0.1:{_BASE_PORT + 22}") as single,
+            zmq_socket_pair(
+                f"tcp://127.0.0.1:{_BASE_PORT + 23}",
+                f"tcp://127.0.0.1:{_BASE_PORT + 24}",
+            ) as (a, b),
+        ):
+            assert single.context is zmq.Context.instance()
+            assert a.context is single.context
+            assert b.context is single.context
+
+    def test_context_survives_socket_cleanup(self) -> None:
+        with zmq_socket(zmq.PUB, f"tcp://127.0.0.1:{_BASE_PORT + 25}"):
+            pass
+        assert not zmq.Context.instance().closed